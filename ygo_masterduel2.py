@@ -9,6 +9,8 @@ from scipy.stats import hypergeom
 from fpdf import FPDF
 from unidecode import unidecode
 import io
+import tempfile
+import uuid
 import pandas as pd
 import requests
 
@@ -52,6 +54,22 @@ TRS = {
         "graph_mc": "Probabilité par rôle (Monte Carlo)",
         "donut_title": "Répartition des rôles dans le deck",
         "hist_title": "Histogramme de la taille de main pour chaque rôle",
+        "sens_title": "Sensibilité : valeur marginale de chaque carte",
+        "sens_caption": "Variation en points de % si on ajoute/retire une carte du type (q±1) ou une carte neutre du deck (deck±1).",
+        "sens_q_plus": "q+1 rôle",
+        "sens_q_minus": "q-1 rôle",
+        "sens_q_plus_global": "q+1 global",
+        "sens_q_minus_global": "q-1 global",
+        "sens_deck_plus": "deck+1 rôle",
+        "sens_deck_minus": "deck-1 rôle",
+        "sens_deck_global": "Effet de deck±1 sur la probabilité globale",
+        "export_hands": "Exporter les mains simulées (.npy)",
+        "sim_seed": "Graine aléatoire (0 = aléatoire)",
+        "hands_title": "Mains simulées exportées",
+        "download_hands": "Télécharger les mains (.npy)",
+        "download_hands_meta": "Télécharger les métadonnées (.json)",
+        "rescore": "Re-scorer les mains avec les min/max actuels",
+        "rescore_warn": "Les quantités (q) ou la taille du deck/main ont changé depuis l'export : les mains ne correspondent plus au deck actuel.",
     },
     "en": {
         "deck_name": "Deck name",
@@ -81,6 +99,22 @@ TRS = {
         "graph_mc": "Role probability (Monte Carlo)",
         "donut_title": "Role distribution in the deck",
         "hist_title": "Hand size histogram per role",
+        "sens_title": "Sensitivity: marginal value of each card",
+        "sens_caption": "Change in % points when adding/removing one card of the type (q±1) or one neutral card from the deck (deck±1).",
+        "sens_q_plus": "q+1 role",
+        "sens_q_minus": "q-1 role",
+        "sens_q_plus_global": "q+1 overall",
+        "sens_q_minus_global": "q-1 overall",
+        "sens_deck_plus": "deck+1 role",
+        "sens_deck_minus": "deck-1 role",
+        "sens_deck_global": "Effect of deck±1 on the overall probability",
+        "export_hands": "Export simulated hands (.npy)",
+        "sim_seed": "Random seed (0 = random)",
+        "hands_title": "Exported simulated hands",
+        "download_hands": "Download hands (.npy)",
+        "download_hands_meta": "Download metadata (.json)",
+        "rescore": "Re-score hands with current min/max",
+        "rescore_warn": "Quantities (q) or deck/hand size changed since the export: the hands no longer match the current deck.",
     }
 }
 
@@ -131,6 +165,8 @@ else:
 st.session_state["n_sim"] = st.sidebar.number_input(
     T["n_sim"], 1000, 100000, st.session_state["n_sim"], step=1000
 )
+export_hands = st.sidebar.checkbox(T["export_hands"], value=False)
+sim_seed = st.sidebar.number_input(T["sim_seed"], 0, 2**31 - 1, 0) if export_hands else 0
 # --------- TITRE PRINCIPAL & CONFIGURATION DES CATEGORIES ---------
 st.title(T["main_title"])
 st.caption(T["subtitle"])
@@ -287,17 +323,153 @@ def hypergeom_prob(deck_size, hand_size, categories):
         maxs[cat['name']] = cat['max']
     details = {}
     for r in roles:
-        rv = hypergeom(deck_size, counts[r], hand_size)
-        p = 0.0
-        for k in range(mins[r], maxs[r]+1):
-            p += rv.pmf(k)
-        details[r] = p*100
+        details[r] = role_prob(deck_size, hand_size, counts[r], mins[r], maxs[r])
     return details
 
+def role_prob(deck_size, hand_size, q, mn, mx):
+    """
+    Probabilité (en %) d'avoir entre mn et mx cartes d'un type présent q fois dans le deck.
+    Retourne None si la configuration est impossible (deck plus petit que la main ou que q).
+    """
+    if q < 0 or deck_size < max(q, hand_size):
+        return None
+    rv = hypergeom(deck_size, q, hand_size)
+    p = 0.0
+    for k in range(mn, mx+1):
+        p += rv.pmf(k)
+    return p*100
+
+def role_factor(p, baseline=None):
+    """
+    Facteur d'un rôle (probabilité p en %) dans le produit global.
+    Un rôle dont la probabilité de référence (baseline, par défaut p) vaut 0% est ignoré
+    (facteur 1) ; sinon le facteur vaut p/100, y compris 0 si p tombe à 0%.
+    """
+    ref = p if baseline is None else baseline
+    return p / 100 if ref > 0 else 1
+
+def global_prob(details, baseline=None):
+    """
+    Probabilité globale = produit des probabilités par rôle (les rôles à 0% sont ignorés).
+    baseline : {role: proba de référence} pour décider quels rôles ignorer (optionnel).
+    """
+    g = 1.0
+    for r, v in details.items():
+        g *= role_factor(v, baseline[r] if baseline else None)
+    return g * 100
+
+# --- Sensibilité : effet de q±1 et deck_size±1 sur chaque rôle et sur le global ---
+def role_sensitivity(deck_size, hand_size, cat):
+    """
+    Probabilités (en %) du type pour q±1 (taille du deck inchangée) et deck_size±1
+    (une carte neutre en plus/en moins). Ne dépend que du type lui-même.
+    """
+    sens = {}
+    for step in (+1, -1):
+        sign = "+1" if step > 0 else "-1"
+        sens[f"q{sign}"] = role_prob(deck_size, hand_size, cat["q"] + step, cat["min"], cat["max"])
+        sens[f"deck{sign}"] = role_prob(deck_size + step, hand_size, cat["q"], cat["min"], cat["max"])
+    return sens
+
+def sensitivity_table(deck_size, hand_size, categories, details, theor_global, role_sens=None):
+    """
+    Pour chaque type, calcule la variation (en points de %) de sa probabilité et de la
+    probabilité globale si on ajoute/retire une carte de ce type (q±1, taille du deck inchangée)
+    ou si le deck gagne/perd une carte neutre (deck_size±1).
+    Calcul incrémental : q±1 ne modifie que le facteur du rôle concerné dans le produit global,
+    donc seules 2 lois hypergéométriques par rôle sont recalculées (+2 pour deck_size±1).
+    role_sens : {role: role_sensitivity(...)} déjà calculé (optionnel, ex. depuis le cache).
+    Retourne (lignes, {"deck+1": delta_global, "deck-1": delta_global}).
+    """
+    def delta(new, old):
+        return None if new is None else new - old
+
+    rows = []
+    deck_details = {+1: {}, -1: {}}
+    for cat in categories:
+        r = cat["name"]
+        p = details[r]
+        sens = role_sens[r] if role_sens and r in role_sens else role_sensitivity(deck_size, hand_size, cat)
+        row = {"role": r}
+        for step in (+1, -1):
+            sign = "+1" if step > 0 else "-1"
+            p_q = sens[f"q{sign}"]
+            row[f"q{sign}"] = delta(p_q, p)
+            # Seul le facteur du rôle change dans le produit global
+            g_q = None if p_q is None else theor_global / role_factor(p) * role_factor(p_q, p)
+            row[f"q{sign}_global"] = delta(g_q, theor_global)
+            p_d = sens[f"deck{sign}"]
+            row[f"deck{sign}"] = delta(p_d, p)
+            deck_details[step][r] = p_d
+        rows.append(row)
+    deck_global = {}
+    for step, d in deck_details.items():
+        sign = "+1" if step > 0 else "-1"
+        if any(v is None for v in d.values()):
+            deck_global[f"deck{sign}"] = None
+        else:
+            deck_global[f"deck{sign}"] = global_prob(d, details) - theor_global
+    return rows, deck_global
+
+# --- Recalcul incrémental : seuls les types dont q/min/max a changé sont recalculés ---
+def incremental_theory(deck_size, hand_size, categories, lang, cache):
+    """
+    Version incrémentale de hypergeom_prob + global_prob + explications + sensibilité.
+    cache : dict persistant entre deux calculs (st.session_state["theor_cache"]), modifié en place.
+    Un type n'est recalculé que si son (q, min, max) a changé ; si la taille du deck ou de la
+    main change, tout est invalidé. La probabilité globale est mise à jour en remplaçant
+    uniquement les facteurs des types modifiés dans le produit précédent.
+    Retourne (details, theor_global, explanations, role_sens, roles_modifiés).
+    """
+    if cache.get("deck") != (deck_size, hand_size):
+        cache.clear()
+        cache["deck"] = (deck_size, hand_size)
+        cache["roles"] = {}
+    old_roles = cache["roles"]
+    new_roles = {}
+    changed = []
+    for cat in categories:
+        r = cat["name"]
+        key = (cat["q"], cat["min"], cat["max"])
+        entry = old_roles.get(r)
+        if entry is None or entry["key"] != key:
+            entry = {
+                "key": key,
+                "p": role_prob(deck_size, hand_size, cat["q"], cat["min"], cat["max"]),
+                "sens": role_sensitivity(deck_size, hand_size, cat),
+            }
+            changed.append(r)
+        if entry.get("lang") != lang or r in changed:
+            entry["lang"] = lang
+            entry["expl"] = role_explanation(r, entry["p"], cat["min"], cat["max"], lang)
+        new_roles[r] = entry
+
+    details = {r: e["p"] for r, e in new_roles.items()}
+    same_roles = set(new_roles) == set(old_roles)
+    if "global" in cache and same_roles and len(changed) < len(new_roles):
+        theor_global = cache["global"]
+        for r in changed:
+            theor_global = theor_global / role_factor(old_roles[r]["p"]) * role_factor(new_roles[r]["p"])
+    else:
+        theor_global = global_prob(details)
+    cache["roles"] = new_roles
+    cache["global"] = theor_global
+
+    explanations = [new_roles[cat["name"]]["expl"] for cat in categories]
+    role_sens = {r: e["sens"] for r, e in new_roles.items()}
+    return details, theor_global, explanations, role_sens, changed
+
 # --- Simule n_sim mains aléatoires, compte les succès pour chaque type ---
-def simulate(deck_size, hand_size, categories, n_sim=10000):
+def simulate(deck_size, hand_size, categories, n_sim=10000, seed=None, export_path=None, chunk_size=4096,
+             return_hands=False):
     """
     Pour chaque simulation, pioche une main, compte pour chaque type si min <= nb <= max.
+    Si export_path est fourni, chaque main est aussi enregistrée (nb de cartes par type, uint8)
+    dans un fichier .npy écrit par blocs de chunk_size mains (mémoire bornée), avec un .json
+    de métadonnées (graine, paramètres du deck) à côté. Voir load_hands / rescore_hands.
+    Rien n'est exporté si le deck est plus petit que la main (aucune main ne peut être tirée).
+    Si return_hands est vrai, retourne aussi les mains tirées (tableau uint8 en mémoire,
+    une colonne par type) pour pouvoir les re-scorer avec d'autres min/max (score_hands).
     Retourne un dict : {role: pourcentage de réussite}
     """
     deck = []
@@ -307,18 +479,106 @@ def simulate(deck_size, hand_size, categories, n_sim=10000):
     mins = {cat['name']: cat['min'] for cat in categories}
     maxs = {cat['name']: cat['max'] for cat in categories}
     success = {r: 0 for r in roles}
-    for _ in range(n_sim):
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy)
+    rng = np.random.default_rng(seed)
+    columns = list(success.keys())
+    kept = np.zeros((n_sim if len(deck) >= hand_size else 0, len(columns)), dtype=np.uint8) if return_hands else None
+    hands = None
+    if len(deck) < hand_size:
+        export_path = None
+    if export_path is not None:
+        hands = np.lib.format.open_memmap(
+            export_path, mode="w+", dtype=np.uint8, shape=(n_sim, len(columns))
+        )
+        buf = np.zeros((min(chunk_size, n_sim), len(columns)), dtype=np.uint8)
+        written = 0
+    for i in range(n_sim):
         if len(deck) < hand_size: break
-        main = np.random.choice(deck, hand_size, replace=False)
+        main = rng.choice(deck, hand_size, replace=False)
         role_counts = {r: 0 for r in roles}
         for card in main:
             role_counts[card] += 1
         for r in roles:
             if mins[r] <= role_counts[r] <= maxs[r]:
                 success[r] += 1
+        if kept is not None:
+            kept[i] = [role_counts[r] for r in columns]
+        if hands is not None:
+            buf[i - written] = [role_counts[r] for r in columns]
+            if i + 1 - written == len(buf) or i + 1 == n_sim:
+                hands[written:i + 1] = buf[:i + 1 - written]
+                hands.flush()
+                written = i + 1
+    if export_path is not None:
+        del hands
+        meta = {
+            "seed": seed,
+            "deck_size": deck_size,
+            "hand_size": hand_size,
+            "n_sim": n_sim,
+            "roles": columns,
+            "categories": [
+                {"name": cat['name'], "q": cat['q'], "min": cat['min'], "max": cat['max']}
+                for cat in categories
+            ],
+            "dtype": "uint8",
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        with open(hands_meta_path(export_path), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
     results = {r: (success[r]/n_sim)*100 for r in roles}
+    if return_hands:
+        return results, kept
     return results
 
+# --- Re-scoring de mains déjà tirées (nb de cartes par type) avec de nouveaux min/max ---
+def score_hands(counts, columns, categories, chunk_size=65536):
+    """
+    counts : tableau (n_mains, nb_types) de nombres de cartes par type, columns : noms des types.
+    Retourne un dict : {role: pourcentage de mains avec min <= nb <= max}, pour les types présents.
+    """
+    targets = [cat for cat in categories if cat['name'] in columns]
+    success = {cat['name']: 0 for cat in targets}
+    for start in range(0, len(counts), chunk_size):
+        block = counts[start:start + chunk_size]
+        for cat in targets:
+            col = block[:, columns.index(cat['name'])]
+            success[cat['name']] += int(np.count_nonzero((col >= cat['min']) & (col <= cat['max'])))
+    n = len(counts)
+    return {r: (success[r]/n)*100 if n else 0.0 for r in success}
+
+# --- Mains simulées exportées : relecture sans copie et re-scoring sans nouveau tirage ---
+def hands_meta_path(export_path):
+    return os.path.splitext(export_path)[0] + ".json"
+
+def load_hands(export_path):
+    """
+    Relit un export de simulate() : tableau (n_sim, nb_types) uint8 mappé en mémoire
+    (lecture seule, sans copie) + dict de métadonnées.
+    """
+    counts = np.load(export_path, mmap_mode="r")
+    with open(hands_meta_path(export_path), encoding="utf-8") as f:
+        meta = json.load(f)
+    return counts, meta
+
+def rescore_hands(counts, meta, categories, chunk_size=65536):
+    """
+    Recalcule les pourcentages Monte Carlo avec les min/max actuels des catégories,
+    à partir des mains déjà tirées (pas de nouveau tirage). Parcourt le fichier par blocs.
+    Les types absents de l'export sont ignorés.
+    Retourne un dict : {role: pourcentage de réussite}
+    """
+    return score_hands(counts, meta["roles"], categories, chunk_size)
+
+def remove_hands_export(export_path):
+    """
+    Supprime un export de simulate() (.npy + .json), s'il existe encore.
+    """
+    for path in (export_path, hands_meta_path(export_path)):
+        if os.path.exists(path):
+            os.remove(path)
+
 # ----------- DICTIONNAIRE EXPLICATIONS PAR TYPE/ROLE ET CAS (multilingue) -----------
 ROLE_EXPLAIN = {
     "starter": {
@@ -565,54 +825,81 @@ def export_results_pdf(deck_name, deck_size, hand_size, first_player, n_sim, the
     return pdf.output(dest="S").encode("latin1")
 
 
+# --- Graphiques : redessinés seulement si les données affichées ont changé ---
+def cached_chart(name, key, draw):
+    """
+    Retourne (figure, png) pour le graphique name ; draw() n'est rappelé que si key a changé
+    depuis le dernier calcul. Le cache vit dans st.session_state["chart_cache"].
+    """
+    cache = st.session_state.setdefault("chart_cache", {})
+    if name not in cache or cache[name][0] != key:
+        if name in cache:
+            plt.close(cache[name][1])
+        fig = draw()
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png")
+        cache[name] = (key, fig, buf.getvalue())
+    _, fig, png = cache[name]
+    return fig, png
+
 # ------------- CALCUL & GÉNÉRATION DES RÉSULTATS --------------
 
 calc = st.button(T["calc"], use_container_width=True)
 if calc:
-    progress = st.empty()
-    progress_text = st.empty()
-    for percent in range(0, 101, 2):
-        time.sleep(0.1)
-        progress.progress(percent / 100)
-        progress_text.write(f"Calcul en cours... ({percent}%)" if lang == "fr" else f"Calculation in progress... ({percent}%)")
-    progress.empty()
-    progress_text.empty()
     st.success("Calcul terminé !" if lang == "fr" else "Calculation done!")
     st.session_state["run_calc_done"] = True
 else:
     st.session_state["run_calc_done"] = False
 
 if st.session_state.get("run_calc_done", False):
-    # 1. Calculs probabilistes
-    details = hypergeom_prob(
+    # 1. Calculs probabilistes (incrémental : seuls les types modifiés sont recalculés)
+    if "theor_cache" not in st.session_state:
+        st.session_state["theor_cache"] = {}
+    details, theor_global, explanations, role_sens, _ = incremental_theory(
         st.session_state["deck_size"],
         st.session_state["hand_size"],
         categories,
+        lang,
+        st.session_state["theor_cache"],
     )
-    theor_global = 1.0
-    for v in details.values():
-        theor_global *= v / 100 if v > 0 else 1
-    theor_global = theor_global * 100
 
-    sim_results = simulate(
+    # Export des mains : un dossier temporaire par session, l'export précédent est supprimé
+    export_path = None
+    if export_hands:
+        if "hands_export_dir" not in st.session_state:
+            st.session_state["hands_export_dir"] = tempfile.mkdtemp(prefix="ygo_hands_")
+        if st.session_state.get("hands_export"):
+            remove_hands_export(st.session_state.pop("hands_export"))
+        export_path = os.path.join(st.session_state["hands_export_dir"], f"hands_{uuid.uuid4().hex}.npy")
+    # Monte Carlo : si seuls des min/max ont changé, on re-score les mains du calcul précédent
+    mc_key = (
         st.session_state["deck_size"],
         st.session_state["hand_size"],
-        categories,
-        st.session_state["n_sim"]
+        st.session_state["n_sim"],
+        tuple((cat["name"], cat["q"]) for cat in categories),
     )
-    monte_global = 1.0
-    for v in sim_results.values():
-        monte_global *= v / 100 if v > 0 else 1
-    monte_global = monte_global * 100
+    mc_cache = st.session_state.get("mc_cache")
+    if export_path is None and mc_cache is not None and mc_cache["key"] == mc_key:
+        sim_results = score_hands(mc_cache["hands"], mc_cache["columns"], categories)
+    else:
+        sim_results, kept_hands = simulate(
+            st.session_state["deck_size"],
+            st.session_state["hand_size"],
+            categories,
+            st.session_state["n_sim"],
+            seed=sim_seed or None,
+            export_path=export_path,
+            return_hands=True,
+        )
+        if len(kept_hands):
+            st.session_state["mc_cache"] = {"key": mc_key, "hands": kept_hands, "columns": list(sim_results)}
+        else:
+            st.session_state.pop("mc_cache", None)
+    monte_global = global_prob(sim_results)
+    if export_path is not None and os.path.exists(export_path):
+        st.session_state["hands_export"] = export_path
 
-    # 2. Explications
-    explanations = []
-    for cat in categories:
-        role = cat['name']
-        p = details.get(role, 0)
-        mn, mx = cat['min'], cat['max']
-        exp = role_explanation(role, p, mn, mx, lang)
-        explanations.append(exp)
+    # 2. Explications : déjà fournies par incremental_theory (régénérées pour les types modifiés)
 
     # 3. Table pour Streamlit
     table = []
@@ -631,29 +918,62 @@ if st.session_state.get("run_calc_done", False):
     st.markdown(f"**{T['theor_global']}** : {theor_global:.2f}%")
     st.markdown(f"**{T['mc_global']}** : {monte_global:.2f}%")
 
-    # 4. Graphiques matplotlib
-    fig, ax = plt.subplots(figsize=(6, 4.5))
+    # 3b. Sensibilité (q±1 / deck_size±1)
+    sens_rows, sens_deck = sensitivity_table(
+        st.session_state["deck_size"],
+        st.session_state["hand_size"],
+        categories,
+        details,
+        theor_global,
+        role_sens,
+    )
+    def fmt_delta(v):
+        return "—" if v is None else f"{v:+.2f}"
+    sens_table = []
+    for row in sens_rows:
+        sens_table.append({
+            T["role"]: row["role"],
+            T["sens_q_plus"]: fmt_delta(row["q+1"]),
+            T["sens_q_minus"]: fmt_delta(row["q-1"]),
+            T["sens_q_plus_global"]: fmt_delta(row["q+1_global"]),
+            T["sens_q_minus_global"]: fmt_delta(row["q-1_global"]),
+            T["sens_deck_plus"]: fmt_delta(row["deck+1"]),
+            T["sens_deck_minus"]: fmt_delta(row["deck-1"]),
+        })
+    st.markdown(f"### {T['sens_title']}")
+    st.caption(T["sens_caption"])
+    st.dataframe(pd.DataFrame(sens_table), hide_index=True, use_container_width=True)
+    st.markdown(
+        f"**{T['sens_deck_global']}** : deck+1 {fmt_delta(sens_deck['deck+1'])} / deck-1 {fmt_delta(sens_deck['deck-1'])}"
+    )
+
+    # 4. Graphiques matplotlib (redessinés seulement si leurs données ont changé)
     roles = [cat["name"] for cat in categories]
     values = [details[cat["name"]] for cat in categories]
-    colors = ["#08e078", "#f44", "#11e1e1", "#ffc300", "#fc51fa", "#ff5757"][:len(roles)]
-    ax.barh(roles, values, color=colors)
-    ax.set_xlabel('Probabilité (%)' if lang == "fr" else "Probability (%)")
-    ax.set_title(T["graph_theor"])
-    st.pyplot(fig, use_container_width=True)
-
-    fig2, ax2 = plt.subplots(figsize=(4, 4))
     sizes = [cat["q"] for cat in categories]
-    ax2.pie(sizes, labels=roles, autopct="%1.0f%%", startangle=90)
-    ax2.set_title(T["donut_title"])
+
+    def draw_bars():
+        fig, ax = plt.subplots(figsize=(6, 4.5))
+        colors = ["#08e078", "#f44", "#11e1e1", "#ffc300", "#fc51fa", "#ff5757"][:len(roles)]
+        ax.barh(roles, values, color=colors)
+        ax.set_xlabel('Probabilité (%)' if lang == "fr" else "Probability (%)")
+        ax.set_title(T["graph_theor"])
+        return fig
+
+    def draw_donut():
+        fig2, ax2 = plt.subplots(figsize=(4, 4))
+        ax2.pie(sizes, labels=roles, autopct="%1.0f%%", startangle=90)
+        ax2.set_title(T["donut_title"])
+        return fig2
+
+    fig, png = cached_chart("bars", (tuple(roles), tuple(values), lang), draw_bars)
+    st.pyplot(fig, use_container_width=True)
+    fig2, png2 = cached_chart("donut", (tuple(roles), tuple(sizes), lang), draw_donut)
     st.pyplot(fig2, use_container_width=True)
 
     # 5. Buffers images pour PDF
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png")
-    buf.seek(0)
-    buf2 = io.BytesIO()
-    fig2.savefig(buf2, format="png")
-    buf2.seek(0)
+    buf = io.BytesIO(png)
+    buf2 = io.BytesIO(png2)
 
     # 6. Analyse IA (optionnelle)
     stats_txt = ""
@@ -700,3 +1020,37 @@ if st.session_state.get("run_calc_done", False):
         ),
         file_name="simulation_ygo.pdf"
     )
+
+# ------------- MAINS EXPORTÉES : TÉLÉCHARGEMENT & RE-SCORING --------------
+
+hands_path = st.session_state.get("hands_export")
+if hands_path and os.path.exists(hands_path):
+    st.markdown(f"### {T['hands_title']}")
+    counts, meta = load_hands(hands_path)
+    st.caption(
+        f"{os.path.basename(hands_path)} — {counts.shape[0]} x {counts.shape[1]} uint8, seed {meta['seed']}"
+    )
+    col1, col2 = st.columns(2)
+    with col1:
+        with open(hands_path, "rb") as f:
+            st.download_button(T["download_hands"], data=f.read(), file_name=os.path.basename(hands_path))
+    with col2:
+        with open(hands_meta_path(hands_path), "rb") as f:
+            st.download_button(
+                T["download_hands_meta"], data=f.read(),
+                file_name=os.path.basename(hands_meta_path(hands_path))
+            )
+    if st.button(T["rescore"]):
+        export_q = {cat["name"]: cat["q"] for cat in meta["categories"]}
+        if (
+            meta["deck_size"] != st.session_state["deck_size"]
+            or meta["hand_size"] != st.session_state["hand_size"]
+            or any(export_q.get(cat["name"]) != cat["q"] for cat in categories)
+        ):
+            st.warning(T["rescore_warn"])
+        rescored = rescore_hands(counts, meta, categories)
+        st.dataframe(
+            pd.DataFrame([{T["role"]: r, T["montecarlo"]: round(v, 2)} for r, v in rescored.items()]),
+            hide_index=True, use_container_width=True
+        )
+        st.markdown(f"**{T['mc_global']}** : {global_prob(rescored):.2f}%")